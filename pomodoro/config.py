@@ -2,6 +2,9 @@
 
 WORK_TIME_MIN = 25
 BREAK_TIME_MIN = 5
+LONG_BREAK_TIME_MIN = 15
+POMODOROS_UNTIL_LONG_BREAK = 4
+WARNING_THRESHOLD = 0.1
 BEEP_FREQUENCY = 440
 BEEP_DURATION = 0.3
 BEEP_VOLUME = 0.5
@@ -0,0 +1,87 @@
+# core.py
+#
+# Tk-free timer state machine: phase transitions, pomodoro counting and
+# time formatting live here so they can run (and be tested) without a
+# display. The Tk front end subclasses this and repaints via the
+# _on_phase_changed hook.
+
+from .config import WARNING_THRESHOLD
+
+# Phase table: phase -> (duration attribute, label key, running color).
+# Transitions read this instead of re-deriving duration/label/color from
+# nested is_working branches in every method.
+PHASES = {
+    "work": ("work_time", "labels.work", "blue"),
+    "short_break": ("break_time", "labels.break", "green"),
+    "long_break": ("long_break_time", "labels.long_break", "green"),
+}
+
+class PomodoroCore:
+    # Lazily grown MM:SS lookup table shared by all instances; the tick
+    # path then formats time with a single list index instead of an
+    # f-string allocation.
+    _FMT_CACHE = []
+
+    def __init__(self, work_time_min=25, break_time_min=5,
+                 long_break_time_min=15, pomodoros_until_long_break=4):
+        self.work_time = work_time_min * 60
+        self.break_time = break_time_min * 60
+        self.long_break_time = long_break_time_min * 60
+        # Integer warning cutoff, recomputed only when work_time changes.
+        self._warn_at = int(WARNING_THRESHOLD * self.work_time)
+        self.pomodoros_until_long_break = pomodoros_until_long_break
+        self._phase = "work"
+        self.is_working = True
+        self.timer_running = False
+        self.paused = False
+        self.time_left = self.work_time
+        # Absolute deadline on the monotonic clock; ticks recompute the
+        # remaining time from it instead of counting scheduled callbacks,
+        # so scheduling latency never accumulates as drift.
+        self.end_time = None
+        self.pomodoro_count = 0
+        # Pomodoros completed since the last long break; counting up and
+        # resetting avoids the modulo arithmetic a raw count would need.
+        self._pomos_since_long = 0
+        self._label_key = "labels.work"
+
+    def format_time(self, seconds):
+        cache = self._FMT_CACHE
+        if seconds >= len(cache):
+            cache.extend(f"{s // 60:02}:{s % 60:02}" for s in range(len(cache), seconds + 1))
+        return cache[seconds]
+
+    def _should_warn(self):
+        return self.is_working and self.time_left <= self._warn_at
+
+    def _next_phase(self):
+        if self._phase == "work":
+            if self._pomos_since_long + 1 >= self.pomodoros_until_long_break:
+                return "long_break"
+            return "short_break"
+        return "work"
+
+    def _enter_phase(self, phase):
+        duration_attr, label_key, color = PHASES[phase]
+        if phase == "long_break":
+            self._pomos_since_long = 0
+        elif phase == "short_break":
+            self._pomos_since_long += 1
+        self._phase = phase
+        self.is_working = phase == "work"
+        self.time_left = getattr(self, duration_attr)
+        self._label_key = label_key
+        self._on_phase_changed(color)
+
+    def _on_phase_changed(self, color):
+        # UI hook; the core itself has nothing to repaint.
+        pass
+
+    def _advance_phase(self):
+        self._enter_phase(self._next_phase())
+
+    def complete_phase(self):
+        # A finished work phase counts as a pomodoro before moving on.
+        if self.is_working:
+            self.pomodoro_count += 1
+        self._advance_phase()
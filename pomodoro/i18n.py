@@ -0,0 +1,68 @@
+# i18n.py
+
+import logging
+import os
+from functools import cache
+from . import jsonio
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LOCALES_DIR = os.path.join(BASE_DIR, 'locales')
+DEFAULT_LANGUAGE = "en"
+
+_translations = {}
+_language = DEFAULT_LANGUAGE
+
+@cache
+def detect_system_language():
+    # A direct env peek instead of locale.getdefaultlocale(), which is
+    # deprecated since 3.11 and re-parses the environment on every call.
+    # The system locale never changes mid-process, so cache the result.
+    lang = (
+        os.environ.get("LANG")
+        or os.environ.get("LC_ALL")
+        or os.environ.get("LC_MESSAGES")
+        or ""
+    ).split(".")[0].split("_")[0].lower()
+    if lang == "ru":
+        return "ru"
+    return DEFAULT_LANGUAGE
+
+def get_language():
+    return _language
+
+def load_translations(language=None):
+    global _translations, _language
+    if language is None:
+        language = detect_system_language()
+    path = os.path.join(LOCALES_DIR, f"{language}.json")
+    if not os.path.exists(path):
+        language = DEFAULT_LANGUAGE
+        path = os.path.join(LOCALES_DIR, f"{language}.json")
+    with open(path, 'rb') as f:
+        _translations = dict(_flatten(jsonio.loads(f.read())))
+    _language = language
+    logger.debug("Loaded %d translations for '%s'", len(_translations), language)
+
+def _flatten(d, prefix=""):
+    # Collapse the nested catalog into dotted keys once at load time, so
+    # t() is a single dict lookup instead of a split + nested walk.
+    for k, v in d.items():
+        key = f"{prefix}.{k}" if prefix else k
+        if isinstance(v, dict):
+            yield from _flatten(v, key)
+        else:
+            yield key, v
+
+def t(key, **kwargs):
+    value = _translations.get(key)
+    if value is None:
+        return key
+    if kwargs:
+        return value.format(**kwargs)
+    return value
+
+# Load the catalog eagerly so t() never has to test whether it happened;
+# the lookup path is then a single dict.get.
+load_translations()
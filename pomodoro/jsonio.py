@@ -0,0 +1,20 @@
+# jsonio.py
+#
+# JSON helpers shared by settings/statistics/i18n: orjson when available
+# (several times faster for both directions), stdlib json otherwise.
+# Both variants work in bytes so callers open files in binary mode.
+
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    loads = orjson.loads
+except ImportError:
+    import json
+
+    def dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+    loads = json.loads
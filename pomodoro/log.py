@@ -0,0 +1,36 @@
+# log.py
+
+import logging
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_FILE = os.path.join(BASE_DIR, 'data', 'pomodoro.log')
+
+def setup_logging(level=logging.INFO):
+    logger = logging.getLogger("pomodoro")
+    if logger.handlers:
+        return logger
+    logger.setLevel(level)
+    # We own our handlers; don't also hand records to the root logger.
+    logger.propagate = False
+
+    # %H:%M:%S instead of the default asctime format: cheaper to render
+    # per record and the date adds nothing for a single-session log.
+    formatter = logging.Formatter(
+        "%(asctime)s %(name)s %(levelname)s: %(message)s",
+        datefmt="%H:%M:%S",
+    )
+
+    stream = logging.StreamHandler()
+    stream.setFormatter(formatter)
+    logger.addHandler(stream)
+
+    if not os.path.exists(os.path.dirname(LOG_FILE)):
+        os.makedirs(os.path.dirname(LOG_FILE))
+    # delay=True keeps the file closed until the first record is actually
+    # emitted, so runs that never log skip the open() entirely.
+    file_handler = logging.FileHandler(LOG_FILE, delay=True)
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
+
+    return logger
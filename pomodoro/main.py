@@ -1,9 +1,11 @@
 # main.py
 
+from pomodoro.log import setup_logging
 from pomodoro.ui.main import PomodoroTimer
 
 if __name__ == "__main__":
     import tkinter as tk
+    setup_logging()
     root = tk.Tk()
     app = PomodoroTimer(master=root)
     root.mainloop()
@@ -0,0 +1,66 @@
+# settings.py
+
+import logging
+import os
+from . import jsonio
+from .config import (
+    WORK_TIME_MIN,
+    BREAK_TIME_MIN,
+    LONG_BREAK_TIME_MIN,
+    POMODOROS_UNTIL_LONG_BREAK,
+)
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_FILE = os.path.join(BASE_DIR, 'data', 'config.json')
+
+DEFAULT_SETTINGS = {
+    "work_time_min": WORK_TIME_MIN,
+    "break_time_min": BREAK_TIME_MIN,
+    "long_break_time_min": LONG_BREAK_TIME_MIN,
+    "pomodoros_until_long_break": POMODOROS_UNTIL_LONG_BREAK,
+}
+
+# Parsed settings keyed by the config file's mtime; repeat loads return a
+# copy of the cached dict instead of re-reading and re-parsing the file.
+_cache = None
+
+def load_settings():
+    global _cache
+    settings = DEFAULT_SETTINGS.copy()
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return settings
+    if _cache is not None and _cache[0] == st.st_mtime_ns:
+        return _cache[1].copy()
+    try:
+        with open(CONFIG_FILE, 'rb') as f:
+            settings.update(jsonio.loads(f.read()))
+    except (ValueError, OSError) as exc:
+        logger.warning("Could not read %s: %s", CONFIG_FILE, exc)
+        return settings
+    _cache = (st.st_mtime_ns, settings.copy())
+    return settings
+
+def save_settings(settings):
+    global _cache
+    if not os.path.exists(os.path.dirname(CONFIG_FILE)):
+        os.makedirs(os.path.dirname(CONFIG_FILE))
+    # Write to a sibling tempfile and rename over the config so a crash
+    # mid-write can never leave a torn half-written file behind.
+    tmp = CONFIG_FILE + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(jsonio.dumps(settings))
+    os.replace(tmp, CONFIG_FILE)
+    _cache = (os.stat(CONFIG_FILE).st_mtime_ns, settings.copy())
+    logger.debug("Saved settings: %s", settings)
+
+def get_setting(key):
+    return load_settings().get(key, DEFAULT_SETTINGS.get(key))
+
+def set_setting(key, value):
+    settings = load_settings()
+    settings[key] = value
+    save_settings(settings)
@@ -0,0 +1,139 @@
+# statistics.py
+
+import atexit
+import logging
+import os
+from . import jsonio
+from datetime import date, datetime
+
+logger = logging.getLogger(__name__)
+
+# msgspec decodes against a typed schema, which both validates the file
+# and runs ~2x faster than generic JSON parsing; statistics.json grows
+# with history, so decode speed matters on startup. Optional, like orjson
+# in jsonio: without it we fall back to plain dict parsing.
+try:
+    import msgspec
+
+    class _Stats(msgspec.Struct):
+        total_pomodoros: int = 0
+        total_work_minutes: int = 0
+        daily_stats: dict = {}
+        weekly_stats: dict = {}
+        current_streak: int = 0
+        last_pomodoro_date: str | None = None
+
+    def _decode_stats(data):
+        decoded = msgspec.json.decode(data, type=_Stats)
+        return msgspec.structs.asdict(decoded)
+
+    def _encode_stats(stats):
+        return msgspec.json.encode(stats)
+
+    _DECODE_ERRORS = (msgspec.DecodeError, msgspec.ValidationError)
+except ImportError:
+    _decode_stats = jsonio.loads
+    _encode_stats = jsonio.dumps
+    _DECODE_ERRORS = (ValueError,)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATS_FILE = os.path.join(BASE_DIR, 'data', 'statistics.json')
+
+DEFAULT_STATISTICS = {
+    "total_pomodoros": 0,
+    "total_work_minutes": 0,
+    "daily_stats": {},
+    "weekly_stats": {},
+    "current_streak": 0,
+    "last_pomodoro_date": None,
+}
+
+# Statistics live in memory after the first load; record_pomodoro mutates
+# this dict and marks it dirty, and the file is rewritten on flush/exit
+# rather than once per pomodoro. As daily_stats grows over the years that
+# keeps the per-pomodoro cost O(1) instead of O(history).
+_stats = None
+_dirty = False
+
+def load_statistics():
+    global _stats
+    if _stats is None:
+        stats = DEFAULT_STATISTICS.copy()
+        stats["daily_stats"] = {}
+        stats["weekly_stats"] = {}
+        if os.path.exists(STATS_FILE):
+            try:
+                with open(STATS_FILE, 'rb') as f:
+                    stats.update(_decode_stats(f.read()))
+            except _DECODE_ERRORS + (OSError,) as exc:
+                logger.warning("Could not read %s: %s", STATS_FILE, exc)
+        _stats = stats
+    return _stats
+
+def save_statistics(stats):
+    if not os.path.exists(os.path.dirname(STATS_FILE)):
+        os.makedirs(os.path.dirname(STATS_FILE))
+    with open(STATS_FILE, 'wb') as f:
+        f.write(_encode_stats(stats))
+
+def flush_statistics():
+    global _dirty
+    if _dirty:
+        save_statistics(load_statistics())
+        _dirty = False
+        logger.debug("Flushed statistics to %s", STATS_FILE)
+
+atexit.register(flush_statistics)
+
+# (today_iso, week_key) for the current day; isocalendar() allocates a
+# named tuple per call, so recompute the week key only when the day rolls
+# over. Matters mostly for batch imports/replays.
+_week_key_cache = None
+
+def _get_week_key(today_iso):
+    global _week_key_cache
+    if _week_key_cache is None or _week_key_cache[0] != today_iso:
+        iso_year, iso_week, _ = datetime.now().isocalendar()
+        _week_key_cache = (today_iso, f"{iso_year}-W{iso_week:02d}")
+    return _week_key_cache[1]
+
+def record_pomodoro(work_minutes):
+    global _dirty
+    stats = load_statistics()
+    today = date.today()
+    today_iso = today.isoformat()
+    week_key = _get_week_key(today_iso)
+
+    stats["total_pomodoros"] += 1
+    stats["total_work_minutes"] += work_minutes
+    stats["daily_stats"][today_iso] = stats["daily_stats"].get(today_iso, 0) + 1
+    stats["weekly_stats"][week_key] = stats["weekly_stats"].get(week_key, 0) + 1
+
+    last = stats.get("last_pomodoro_date")
+    if last:
+        diff = (today - date.fromisoformat(last)).days
+        if diff == 1:
+            stats["current_streak"] += 1
+        elif diff > 1:
+            stats["current_streak"] = 1
+    else:
+        stats["current_streak"] = 1
+    stats["last_pomodoro_date"] = today_iso
+
+    _dirty = True
+    return stats
+
+def get_today_stats():
+    stats = load_statistics()
+    today_iso = date.today().isoformat()
+    return {
+        "pomodoros": stats["daily_stats"].get(today_iso, 0),
+        "streak": stats["current_streak"],
+    }
+
+def get_total_stats():
+    stats = load_statistics()
+    return {
+        "pomodoros": stats["total_pomodoros"],
+        "work_minutes": stats["total_work_minutes"],
+    }
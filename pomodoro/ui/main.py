@@ -1,138 +1,412 @@
+import time
 import tkinter as tk
+import tkinter.font as tkfont
+from contextlib import contextmanager
+from functools import lru_cache
 from tkinter import messagebox
+from ..core import PomodoroCore
 from ..utils.sound import play_sound
-from ..config import WORK_TIME_MIN, BREAK_TIME_MIN
+from ..settings import load_settings, save_settings
+from ..statistics import record_pomodoro, get_today_stats, get_total_stats
+from ..i18n import t, load_translations, get_language
+from ..config import WARNING_THRESHOLD
 
-class PomodoroTimer:
+@lru_cache(maxsize=None)
+def _tc(key):
+    # Cached t() for keys without format arguments; cleared on language change.
+    return t(key)
+
+# Minute values are tiny (at most 24h), so pre-render their strings once
+# instead of paying an int->str conversion on every reset/focus.
+_MIN_STR = tuple(str(i) for i in range(1441))
+
+def _min_str(minutes):
+    return _MIN_STR[minutes] if 0 <= minutes < len(_MIN_STR) else str(minutes)
+
+# Accepted ranges for the settings entries.
+MINUTES_RANGE = (1, 1440)
+CYCLE_RANGE = (1, 10)
+
+class PomodoroTimer(PomodoroCore):
     def __init__(self, master):
         self.master = master
-        self.master.title("Pomodoro Timer")
+        self.settings = load_settings()
+        load_translations(self.settings.get("language"))
+        _tc.cache_clear()
+        self.master.title(_tc("app.title"))
         self.master.resizable(False, False)
+        # Timer state (phases, counts, durations) lives in PomodoroCore;
+        # only the widget plumbing below is Tk-specific.
+        super().__init__(
+            work_time_min=self.settings["work_time_min"],
+            break_time_min=self.settings["break_time_min"],
+            long_break_time_min=self.settings["long_break_time_min"],
+            pomodoros_until_long_break=self.settings["pomodoros_until_long_break"],
+        )
+        self._after_id = None
+        self._last_rendered_text = None
+        self.progress_dots = []
+        # Widget configs issued inside a _batched_updates() block are
+        # coalesced and flushed as one burst when the outermost block exits.
+        self._pending_configs = {}
+        self._batch_depth = 0
+        self._current_color = None
+        # (monotonic timestamp, today, total) with a short TTL so rapid
+        # transitions (skip spam) don't re-read the stats file each time.
+        self._stats_cache = None
 
-        self.work_time = WORK_TIME_MIN * 60
-        self.break_time = BREAK_TIME_MIN * 60
-        self.is_working = True
-        self.timer_running = False
-        self.time_left = self.work_time
+        # The settings frame is built lazily on the first "Show Settings"
+        # click; cold start only pays for the widgets that are visible.
+        self.settings_frame = None
+        self.settings_visible = False
+        # Static (widget, key) pairs retranslated on every language change;
+        # conditional texts are handled separately in _refresh_ui_texts.
+        self._refresh_plan = []
 
-        self.create_widgets()
-        self.settings_frame.grid_remove()
-        self.settings_visible = not self.settings_visible
+        self._create_core_widgets()
+
+    def _create_core_widgets(self):
+        # One Font object per distinct size; passing ("Helvetica", N)
+        # tuples makes Tk re-resolve the font metrics for every widget.
+        self._f48 = tkfont.Font(family="Helvetica", size=48)
+        self._f24 = tkfont.Font(family="Helvetica", size=24)
+        self._f14 = tkfont.Font(family="Helvetica", size=14)
+        self._f12 = tkfont.Font(family="Helvetica", size=12)
 
-    def create_widgets(self):
-        self.label = tk.Label(self.master, text="Work Time", font=("Helvetica", 24))
+        self.label = tk.Label(self.master, text=_tc(self._label_key), font=self._f24)
         self.label.grid(row=0, column=0, columnspan=2, pady=10)
 
-        self.time_label = tk.Label(self.master, text=self.format_time(self.time_left), font=("Helvetica", 48))
+        # textvariable-bound labels update via a direct Tcl variable set
+        # instead of re-parsing config() kwargs on every change.
+        self.time_var = tk.StringVar(value=self.format_time(self.time_left))
+        self.time_label = tk.Label(self.master, textvariable=self.time_var, font=self._f48)
         self.time_label.grid(row=1, column=0, columnspan=2, pady=10)
 
+        self.counter_var = tk.StringVar(value=t("labels.pomodoros", count=0))
+        self.counter_label = tk.Label(self.master, textvariable=self.counter_var, font=self._f14)
+        self.counter_label.grid(row=2, column=0, columnspan=2, pady=5)
+
+        self.dots_frame = tk.Frame(self.master)
+        self.dots_frame.grid(row=3, column=0, columnspan=2, pady=5)
+        self._create_progress_dots()
+
+        self.toggle_button = tk.Button(self.master, text=_tc("buttons.show_settings"), command=self.toggle_settings, font=self._f14)
+        self.toggle_button.grid(row=5, column=0, columnspan=2, pady=10)
+
+        self.start_button = tk.Button(self.master, text=_tc("buttons.start"), command=self.start_timer, font=self._f14)
+        self.start_button.grid(row=6, column=0, padx=20, pady=10)
+
+        self.reset_button = tk.Button(self.master, text=_tc("buttons.stop"), command=self.reset_timer, font=self._f14)
+        self.reset_button.grid(row=6, column=1, padx=20, pady=10)
+
+        self.pause_button = tk.Button(self.master, text=_tc("buttons.pause"), command=self.pause_timer, font=self._f14)
+        self.pause_button.grid(row=7, column=0, padx=20, pady=10)
+
+        self.skip_button = tk.Button(self.master, text=_tc("buttons.skip"), command=self.skip_phase, font=self._f14)
+        self.skip_button.grid(row=7, column=1, padx=20, pady=10)
+
+        self.stats_var = tk.StringVar()
+        self.stats_label = tk.Label(self.master, textvariable=self.stats_var, font=self._f12)
+        self.stats_label.grid(row=8, column=0, columnspan=2, pady=5)
+        self.update_stats_display()
+
+        self._refresh_plan += [
+            (self.start_button, "buttons.start"),
+            (self.reset_button, "buttons.stop"),
+            (self.skip_button, "buttons.skip"),
+        ]
+
+        self.set_color("white")
+
+    def _create_settings_widgets(self):
         self.settings_frame = tk.Frame(self.master)
-        self.settings_frame.grid(row=2, column=0, columnspan=2, pady=10)
+        self.settings_frame.grid(row=4, column=0, columnspan=2, pady=10)
+
+        # Inline, non-blocking validation: bad input turns the entry red
+        # instead of popping a modal dialog that stalls the event loop.
+        validate = self.master.register(self._validate_int_range)
 
-        self.work_time_label = tk.Label(self.settings_frame, text="Work time (minutes):", font=("Helvetica", 14))
+        self.work_time_label = tk.Label(self.settings_frame, text=_tc("settings.work_time"), font=self._f14)
         self.work_time_label.grid(row=0, column=0, padx=5, pady=5)
-        self.work_time_entry = tk.Entry(self.settings_frame, font=("Helvetica", 14))
+        self.work_time_entry = tk.Entry(self.settings_frame, font=self._f14, validate="key",
+                                        validatecommand=(validate, "%P", "%W") + MINUTES_RANGE)
         self.work_time_entry.grid(row=0, column=1, padx=5, pady=5)
-        self.work_time_entry.insert(0, str(self.work_time // 60))
+        self.work_time_entry.insert(0, _min_str(self.work_time // 60))
         self.work_time_entry.bind("<FocusIn>", self.select_all_text)
-        self.work_time_entry.bind("<KeyRelease>", self.update_times)
 
-        self.break_time_label = tk.Label(self.settings_frame, text="Break time (minutes):", font=("Helvetica", 14))
+        self.break_time_label = tk.Label(self.settings_frame, text=_tc("settings.break_time"), font=self._f14)
         self.break_time_label.grid(row=1, column=0, padx=5, pady=5)
-        self.break_time_entry = tk.Entry(self.settings_frame, font=("Helvetica", 14))
+        self.break_time_entry = tk.Entry(self.settings_frame, font=self._f14, validate="key",
+                                         validatecommand=(validate, "%P", "%W") + MINUTES_RANGE)
         self.break_time_entry.grid(row=1, column=1, padx=5, pady=5)
-        self.break_time_entry.insert(0, str(self.break_time // 60))
+        self.break_time_entry.insert(0, _min_str(self.break_time // 60))
         self.break_time_entry.bind("<FocusIn>", self.select_all_text)
-        self.break_time_entry.bind("<KeyRelease>", self.update_times)
 
-        self.toggle_button = tk.Button(self.master, text="Show Settings", command=self.toggle_settings, font=("Helvetica", 14)) # на английском показать/скрыть настройки будет show/hide settings
-        self.toggle_button.grid(row=3, column=0, columnspan=2, pady=10)
+        self.cycle_label = tk.Label(self.settings_frame, text=_tc("settings.pomodoro_cycle"), font=self._f14)
+        self.cycle_label.grid(row=2, column=0, padx=5, pady=5)
+        self.cycle_entry = tk.Entry(self.settings_frame, font=self._f14, validate="key",
+                                    validatecommand=(validate, "%P", "%W") + CYCLE_RANGE)
+        self.cycle_entry.grid(row=2, column=1, padx=5, pady=5)
+        self.cycle_entry.insert(0, _min_str(self.pomodoros_until_long_break))
+        self.cycle_entry.bind("<FocusIn>", self.select_all_text)
 
-        self.start_button = tk.Button(self.master, text="Start", command=self.start_timer, font=("Helvetica", 14))
-        self.start_button.grid(row=4, column=0, padx=20, pady=10)
+        self.save_button = tk.Button(self.settings_frame, text=_tc("buttons.save"), command=self.save_current_settings, font=self._f14)
+        self.save_button.grid(row=3, column=0, pady=5)
 
-        self.reset_button = tk.Button(self.master, text="Stop", command=self.reset_timer, font=("Helvetica", 14))
-        self.reset_button.grid(row=4, column=1, padx=20, pady=10)
+        self.language_button = tk.Button(self.settings_frame, text=_tc("buttons.language"), command=self.toggle_language, font=self._f14)
+        self.language_button.grid(row=3, column=1, pady=5)
 
-        self.settings_visible = True
+        self._refresh_plan += [
+            (self.work_time_label, "settings.work_time"),
+            (self.break_time_label, "settings.break_time"),
+            (self.cycle_label, "settings.pomodoro_cycle"),
+            (self.save_button, "buttons.save"),
+            (self.language_button, "buttons.language"),
+        ]
 
-        self.set_color("white")
+    def _create_progress_dots(self):
+        # Destroying and rebuilding every dot on each settings change is
+        # wasteful widget churn; adjust only the delta when the cycle
+        # length actually changed.
+        count = self.pomodoros_until_long_break
+        current = len(self.progress_dots)
+        if count == current:
+            return
+        if count < current:
+            for dot in self.progress_dots[count:]:
+                dot.destroy()
+            del self.progress_dots[count:]
+        else:
+            for i in range(current, count):
+                dot = tk.Label(self.dots_frame, text="○", font=self._f14)
+                dot.grid(row=0, column=i, padx=2)
+                self.progress_dots.append(dot)
+        self.update_progress_dots()
+
+    def update_progress_dots(self):
+        filled = self._pomos_since_long
+        for i, dot in enumerate(self.progress_dots):
+            self._config(dot, text="●" if i < filled else "○")
+
+    def _get_stats(self):
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache[0] < 1.0:
+            return self._stats_cache[1], self._stats_cache[2]
+        today, total = get_today_stats(), get_total_stats()
+        self._stats_cache = (now, today, total)
+        return today, total
+
+    def update_stats_display(self):
+        today, total = self._get_stats()
+        self.stats_var.set(t("labels.stats", today=today["pomodoros"], total=total["pomodoros"]))
 
     def select_all_text(self, event):
         event.widget.select_range(0, 'end')
 
+    def _validate_int_range(self, proposed, widget_name, lo, hi):
+        if proposed and not proposed.isdigit():
+            return False
+        in_range = proposed.isdigit() and int(lo) <= int(proposed) <= int(hi)
+        self.master.nametowidget(widget_name).config(fg="black" if in_range else "red")
+        return True
+
     def set_color(self, color):
-        self.label.config(fg=color)
-        self.time_label.config(fg=color)
+        # The tick calls this every time; skip the Tcl round-trips unless
+        # the color actually changes (a handful of times per session).
+        if color == self._current_color:
+            return
+        self._current_color = color
+        self._config(self.label, fg=color)
+        self._config(self.time_label, fg=color)
+
+    def _config(self, widget, **kwargs):
+        if self._batch_depth:
+            self._pending_configs.setdefault(widget, {}).update(kwargs)
+        else:
+            widget.config(**kwargs)
+
+    @contextmanager
+    def _batched_updates(self):
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending_configs:
+                pending, self._pending_configs = self._pending_configs, {}
+                for widget, kwargs in pending.items():
+                    widget.config(**kwargs)
+                self.master.update_idletasks()
 
     def toggle_settings(self):
+        if self.settings_frame is None:
+            self._create_settings_widgets()
         if self.settings_visible:
             self.settings_frame.grid_remove()
-            self.toggle_button.config(text="Show Settings")
+            self.toggle_button.config(text=_tc("buttons.show_settings"))
         else:
             self.settings_frame.grid()
-            self.toggle_button.config(text="Hide Settings")
+            self.toggle_button.config(text=_tc("buttons.hide_settings"))
         self.settings_visible = not self.settings_visible
 
-    def update_times(self, event):
+    def toggle_language(self):
+        load_translations("ru" if get_language() == "en" else "en")
+        _tc.cache_clear()
+        self.settings["language"] = get_language()
+        save_settings(self.settings)
+        self._refresh_ui_texts()
+
+    def _refresh_ui_texts(self):
+        for widget, key in self._refresh_plan:
+            widget.config(text=_tc(key))
+        self.master.title(_tc("app.title"))
+        self.label.config(text=_tc(self._label_key))
+        self.counter_var.set(t("labels.pomodoros", count=self.pomodoro_count))
+        self.toggle_button.config(text=_tc("buttons.hide_settings" if self.settings_visible else "buttons.show_settings"))
+        self.pause_button.config(text=_tc("buttons.resume" if self.paused else "buttons.pause"))
+
+    def save_current_settings(self):
+        # Apply the entry values first; validation and the expensive
+        # reset/dot work are debounced to this single point.
+        self.update_times()
+        new = {
+            "work_time_min": self.work_time // 60,
+            "break_time_min": self.break_time // 60,
+            "pomodoros_until_long_break": self.pomodoros_until_long_break,
+        }
+        # Only persist keys that actually changed; a no-op save skips the disk write.
+        diff = {k: v for k, v in new.items() if self.settings.get(k) != v}
+        if diff:
+            self.settings.update(diff)
+            save_settings(self.settings)
+        self._flash_saved()
+
+    def _flash_saved(self):
+        self.save_button.config(text=_tc("buttons.saved"))
+        self.master.after(1500, lambda: self.save_button.config(text=_tc("buttons.save")))
+
+    def update_times(self, event=None):
         try:
             work_minutes = int(self.work_time_entry.get())
             break_minutes = int(self.break_time_entry.get())
-            self.work_time = work_minutes * 60
-            self.break_time = break_minutes * 60
-            self.reset_timer()
+            cycle = int(self.cycle_entry.get())
         except ValueError:
-            pass
-
-    def format_time(self, seconds):
-        minutes = seconds // 60
-        seconds = seconds % 60
-        return f"{minutes:02}:{seconds:02}"
+            return
+        if not (MINUTES_RANGE[0] <= work_minutes <= MINUTES_RANGE[1]
+                and MINUTES_RANGE[0] <= break_minutes <= MINUTES_RANGE[1]
+                and CYCLE_RANGE[0] <= cycle <= CYCLE_RANGE[1]):
+            return
+        self.work_time = work_minutes * 60
+        self.break_time = break_minutes * 60
+        self.pomodoros_until_long_break = cycle
+        self._warn_at = int(WARNING_THRESHOLD * self.work_time)
+        self._create_progress_dots()
+        self.reset_timer()
 
     def update_timer(self):
         if self.timer_running:
-            if self.time_left > 0:
-                self.time_left -= 1
-
-                if self.is_working and self.time_left <= 0.1 * self.work_time:
-                    self.set_color("red")
-                else:
-                    self.set_color("blue" if self.is_working else "green")
+            self._tick()
 
-                self.time_label.config(text=self.format_time(self.time_left))
-                self.master.after(1000, self.update_timer)
+    def _tick(self):
+        # Display/transition logic for one tick, kept separate from the
+        # scheduling so the dispatch mechanism can change independently.
+        self.time_left = max(0, int(round(self.end_time - time.monotonic())))
+        if self.time_left > 0:
+            if self._should_warn():
+                self.set_color("red")
             else:
-                play_sound()
-                if self.is_working:
-                    self.time_left = self.break_time
-                    self.label.config(text="Break Time")
-                    self.set_color("green")
-                else:
-                    self.time_left = self.work_time
-                    self.label.config(text="Work Time")
-                    self.set_color("blue")
-                self.is_working = not self.is_working
-                self.update_timer()
+                self.set_color("blue" if self.is_working else "green")
+
+            self._render_time()
+            self._after_id = self.master.after(250, self.update_timer)
+        else:
+            self._handle_timer_complete()
+
+    def _render_time(self):
+        # The label only needs a Tcl call when the rendered string changes,
+        # i.e. about once a second despite the 4 Hz tick.
+        text = self.format_time(self.time_left)
+        if text != self._last_rendered_text:
+            self._last_rendered_text = text
+            self.time_var.set(text)
+
+    def _cancel_tick(self):
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _handle_timer_complete(self):
+        play_sound()
+        with self._batched_updates():
+            was_working = self.is_working
+            self.complete_phase()
+            if was_working:
+                self.counter_var.set(t("labels.pomodoros", count=self.pomodoro_count))
+                record_pomodoro(self.work_time // 60)
+                self._stats_cache = None
+                self.update_stats_display()
+        self.end_time = time.monotonic() + self.time_left
+        self.update_timer()
+
+    def _on_phase_changed(self, color):
+        self.set_color(color)
+        self._config(self.label, text=_tc(self._label_key))
+        self.update_progress_dots()
+
+    def skip_phase(self):
+        with self._batched_updates():
+            self._advance_phase()
+            if self.timer_running:
+                self.end_time = time.monotonic() + self.time_left
+            self._render_time()
 
     def start_timer(self):
         if not self.timer_running:
             play_sound()
             self.timer_running = True
+            self.paused = False
+            self.end_time = time.monotonic() + self.time_left
+            self.update_timer()
+
+    def pause_timer(self):
+        if self.timer_running:
+            self.timer_running = False
+            self.paused = True
+            self._cancel_tick()
+            self.pause_button.config(text=_tc("buttons.resume"))
+        elif self.paused:
+            self.paused = False
+            self.timer_running = True
+            self.end_time = time.monotonic() + self.time_left
+            self.pause_button.config(text=_tc("buttons.pause"))
             self.update_timer()
 
     def reset_timer(self):
+        self._cancel_tick()
         self.timer_running = False
+        self.paused = False
+        self.end_time = None
+        self.pause_button.config(text=_tc("buttons.pause"))
+        self._phase = "work"
         self.is_working = True
         self.time_left = self.work_time
-        self.label.config(text="Work Time")
+        self.pomodoro_count = 0
+        self._pomos_since_long = 0
+        self.counter_var.set(t("labels.pomodoros", count=0))
+        self.update_progress_dots()
+        self._label_key = "labels.work"
+        self.label.config(text=_tc(self._label_key))
         self.set_color("white")
-        self.time_label.config(text=self.format_time(self.time_left))
+        self._last_rendered_text = None
+        self._render_time()
+        self._reset_entry_values()
+
+    def _reset_entry_values(self):
+        if self.settings_frame is None:
+            return
         self.work_time_entry.delete(0, tk.END)
-        self.work_time_entry.insert(0, str(self.work_time // 60))
+        self.work_time_entry.insert(0, _min_str(self.work_time // 60))
         self.break_time_entry.delete(0, tk.END)
-        self.break_time_entry.insert(0, str(self.break_time // 60))
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = PomodoroTimer(master=root)
-    root.mainloop()
+        self.break_time_entry.insert(0, _min_str(self.break_time // 60))
+        self.cycle_entry.delete(0, tk.END)
+        self.cycle_entry.insert(0, _min_str(self.pomodoros_until_long_break))
@@ -1,13 +1,38 @@
 # utils/get_beep_filename.py
 
 import os
-import hashlib
+from functools import cache
 from ..config import BEEP_FREQUENCY, BEEP_DURATION, BEEP_VOLUME
 
+# __file__ is already absolute under normal imports; resolve the assets
+# directory once at import instead of rebuilding the path per call.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.normpath(os.path.join(BASE_DIR, '..', 'assets'))
+
+def _ensure_assets_dir():
+    # One mkdir per session at import, not an exists() check per lookup.
+    if not os.path.isdir(ASSETS_DIR):
+        os.makedirs(ASSETS_DIR)
+
+_ensure_assets_dir()
+
+# The beep parameters are module-level constants, so the resolved path can
+# never change within a process; cache it and skip the stat/mkdir work on
+# every beep after the first.
+@cache
 def get_beep_filename():
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    if not os.path.exists(os.path.join(BASE_DIR, '..', 'assets')):
-        os.makedirs(os.path.join(BASE_DIR, '..', 'assets'))
     params = f"{BEEP_FREQUENCY}_{BEEP_DURATION}_{BEEP_VOLUME}"
-    params_hash = hashlib.md5(params.encode()).hexdigest()
-    return os.path.join(BASE_DIR, '..', 'assets', f'beep_{params_hash}.wav')
+    # A pre-generated beep.wav ships inside the package; when its sidecar
+    # matches the configured parameters, use it and skip runtime synthesis
+    # entirely.
+    bundled = os.path.join(ASSETS_DIR, 'beep.wav')
+    try:
+        with open(bundled + '.meta') as f:
+            if f.read() == params and os.path.exists(bundled):
+                return bundled
+    except OSError:
+        pass
+    # The three config knobs make a short, collision-free, human-readable
+    # key; hashing them bought nothing but a slower call and a longer name.
+    params_key = f"{BEEP_FREQUENCY}-{int(BEEP_DURATION * 1000)}-{int(BEEP_VOLUME * 100)}"
+    return os.path.join(ASSETS_DIR, f'beep_{params_key}.wav')
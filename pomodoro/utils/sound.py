@@ -2,15 +2,38 @@
 
 import os
 import pygame
-from .generate_beep import generate_beep
 from .get_beep_filename import get_beep_filename
 from ..config import BEEP_FREQUENCY, BEEP_DURATION, BEEP_VOLUME
 
-pygame.mixer.init()
+# The mixer is initialized on the first beep, not at import: init opens
+# the audio device and allocates buffers, which costs real startup time
+# and fails outright on machines without audio.
+_initialized = False
+
+# The beep is decoded from disk once into a Sound object; every later
+# play is a single mixer call instead of a load + WAV parse per beep.
+_beep_sound = None
+
+def _ensure_mixer():
+    global _initialized
+    if not _initialized:
+        # Mono at the asset's sample rate with a small buffer; the
+        # defaults allocate stereo buffers we never use.
+        pygame.mixer.init(frequency=44100, size=-16, channels=1, buffer=512)
+        _initialized = True
 
 def play_sound():
-    BEEP_FILENAME = get_beep_filename()
-    if not os.path.exists(BEEP_FILENAME):
-        generate_beep(BEEP_FREQUENCY, BEEP_DURATION, BEEP_VOLUME, BEEP_FILENAME)
-    pygame.mixer.music.load(BEEP_FILENAME)
-    pygame.mixer.music.play()
+    global _beep_sound
+    try:
+        _ensure_mixer()
+    except pygame.error:
+        return
+    if _beep_sound is None:
+        BEEP_FILENAME = get_beep_filename()
+        if not os.path.exists(BEEP_FILENAME):
+            # Only needed when the bundled asset doesn't cover the configured
+            # parameters; importing lazily keeps numpy off the startup path.
+            from .generate_beep import generate_beep
+            generate_beep(BEEP_FREQUENCY, BEEP_DURATION, BEEP_VOLUME, BEEP_FILENAME)
+        _beep_sound = pygame.mixer.Sound(BEEP_FILENAME)
+    _beep_sound.play()
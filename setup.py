@@ -7,6 +7,9 @@ setup(
     author_email="pip@podlevskikh.com",
     version="0.1",
     packages=find_packages(),
+    package_data={
+        "pomodoro": ["assets/beep.wav", "assets/beep.wav.meta", "locales/*.json"],
+    },
     install_requires=[
         "numpy",
         "pygame",
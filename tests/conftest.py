@@ -0,0 +1,80 @@
+# tests/conftest.py
+
+import os
+import sys
+import tkinter as tk
+from unittest.mock import MagicMock
+
+import pytest
+
+from pomodoro.ui.main import PomodoroTimer
+
+# Cheap display probe: on headless CI, skip before paying any Tk
+# initialization cost instead of erroring with TclError mid-fixture.
+HAS_DISPLAY = (
+    sys.platform.startswith(("win", "darwin"))
+    or bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+)
+
+# Stub return values shared by every fixture invocation; building these as
+# fresh MagicMocks per setup was the most expensive part of the fixture
+# after Tk itself.
+_SETTINGS = {
+    "work_time_min": 25,
+    "break_time_min": 5,
+    "long_break_time_min": 15,
+    "pomodoros_until_long_break": 4,
+}
+_TODAY = {"pomodoros": 0, "streak": 0}
+_TOTAL = {"pomodoros": 0, "work_minutes": 0}
+_RECORD = {"total_pomodoros": 1}
+
+# Building a Tk root and a full PomodoroTimer per test dominates the suite's
+# runtime, so one widget tree serves the whole session and each test gets
+# it back via a cheap attribute reset instead of a rebuild.
+@pytest.fixture(scope="session")
+def _timer_instance():
+    if not HAS_DISPLAY:
+        pytest.skip("Tk needs a display; none available")
+    mp = pytest.MonkeyPatch()
+    mp.setattr("pomodoro.ui.main.load_settings", lambda: _SETTINGS)
+    mp.setattr("pomodoro.ui.main.get_today_stats", lambda: _TODAY)
+    mp.setattr("pomodoro.ui.main.get_total_stats", lambda: _TOTAL)
+    mp.setattr("pomodoro.ui.main.record_pomodoro", lambda *a, **k: _RECORD)
+    try:
+        root = tk.Tk()
+    except tk.TclError as exc:
+        mp.undo()
+        pytest.skip(f"Tk unavailable: {exc}")
+    root.withdraw()
+    timer = PomodoroTimer(master=root)
+    yield timer
+    root.destroy()
+    mp.undo()
+
+@pytest.fixture
+def timer(_timer_instance, monkeypatch):
+    t = _timer_instance
+    t._cancel_tick()
+    # No real Tk scheduling during tests: ticks run synchronously and
+    # nothing is left pending to fire between tests or during teardown.
+    # (Not autouse: that would force the Tk fixture onto the core tests.)
+    monkeypatch.setattr(t.master, "after", lambda ms, cb=None, *a: None)
+    monkeypatch.setattr(t.master, "after_cancel", lambda _id: None)
+    t.is_working = True
+    t.timer_running = False
+    t.paused = False
+    t.time_left = t.work_time
+    t.end_time = None
+    t.pomodoro_count = 0
+    t._pomos_since_long = 0
+    t._phase = "work"
+    return t
+
+# One attribute swap per test instead of a mock.patch context manager in
+# every test body; monkeypatch undoes it automatically. No test inspects
+# the messagebox, so a shared MagicMock just swallows any dialog calls.
+@pytest.fixture(autouse=True)
+def _mute_io(monkeypatch):
+    monkeypatch.setattr("pomodoro.ui.main.play_sound", lambda *a, **k: None)
+    monkeypatch.setattr("pomodoro.ui.main.messagebox", MagicMock())
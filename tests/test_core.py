@@ -0,0 +1,61 @@
+# tests/test_core.py
+#
+# Pure state-machine tests against PomodoroCore; no Tk root and no
+# display needed, so these run everywhere the package imports.
+
+import pytest
+
+from pomodoro.core import PomodoroCore
+
+@pytest.fixture
+def core():
+    return PomodoroCore()
+
+def test_initial_state(core):
+    state = (core.is_working, core.timer_running, core.paused,
+             core.time_left, core.pomodoro_count)
+    assert state == (True, False, False, 25 * 60, 0)
+
+@pytest.mark.parametrize("secs,expected", [
+    (0, "00:00"),
+    (65, "01:05"),
+    (90, "01:30"),
+    (3600, "60:00"),
+])
+def test_format_time(core, secs, expected):
+    assert core.format_time(secs) == expected
+
+def test_advance_to_short_break(core):
+    core._advance_phase()
+    assert not core.is_working
+    assert core._phase == "short_break"
+    assert core.time_left == core.break_time
+
+def test_advance_back_to_work(core):
+    core._advance_phase()
+    core._advance_phase()
+    assert core.is_working
+    assert core._phase == "work"
+    assert core.time_left == core.work_time
+
+def test_complete_phase_counts_pomodoro(core):
+    core.complete_phase()
+    assert core.pomodoro_count == 1
+    assert not core.is_working
+
+def test_long_break_after_four_pomodoros(core):
+    # Work and break phases alternate; the 7th completion finishes the
+    # fourth pomodoro and should land on the long break.
+    for _ in range(7):
+        core.complete_phase()
+    assert core.pomodoro_count == 4
+    assert core._phase == "long_break"
+    assert core.time_left == core.long_break_time
+
+def test_should_warn_threshold(core):
+    core.time_left = core._warn_at + 1
+    assert not core._should_warn()
+    core.time_left = core._warn_at
+    assert core._should_warn()
+    core.is_working = False
+    assert not core._should_warn()
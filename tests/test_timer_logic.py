@@ -0,0 +1,58 @@
+# tests/test_timer_logic.py
+
+def test_progress_dots_update(timer):
+    timer._pomos_since_long = 2
+    timer.update_progress_dots()
+    dot_texts = [dot.cget("text") for dot in timer.progress_dots[:4]]
+    assert dot_texts == ["●", "●", "○", "○"]
+
+def test_start_timer(timer):
+    timer.start_timer()
+    assert timer.timer_running
+    assert not timer.paused
+    assert timer.end_time is not None
+
+def test_pause_timer(timer):
+    timer.start_timer()
+    timer.pause_timer()
+    assert not timer.timer_running
+    assert timer.paused
+    assert timer._after_id is None
+
+def test_resume_timer(timer):
+    timer.start_timer()
+    timer.pause_timer()
+    timer.pause_timer()
+    assert timer.timer_running
+    assert not timer.paused
+
+def test_reset_timer(timer):
+    timer.start_timer()
+    timer.reset_timer()
+    assert not timer.timer_running
+    assert not timer.paused
+    assert timer.time_left == timer.work_time
+    assert timer.pomodoro_count == 0
+
+def test_skip_phase_during_work(timer):
+    timer.skip_phase()
+    assert not timer.is_working
+    assert timer._phase == "short_break"
+    assert timer.time_left == timer.break_time
+
+def test_skip_phase_during_break(timer):
+    timer.skip_phase()
+    timer.skip_phase()
+    assert timer.is_working
+    assert timer._phase == "work"
+    assert timer.time_left == timer.work_time
+
+def test_color_changes_for_warning(timer):
+    # The threshold lives in _should_warn, shared with _tick, instead of
+    # being re-derived here.
+    timer.time_left = timer.work_time
+    assert not timer._should_warn()
+    timer.time_left = timer.work_time // 10
+    assert timer._should_warn()
+    timer.set_color("red")
+    assert timer.time_label.cget("fg") == "red"
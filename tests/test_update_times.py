@@ -0,0 +1,14 @@
+# tests/test_update_times.py
+
+import tkinter as tk
+
+def test_update_times(timer):
+    timer.toggle_settings()
+    timer.work_time_entry.delete(0, tk.END)
+    timer.work_time_entry.insert(0, "30")
+    timer.break_time_entry.delete(0, tk.END)
+    timer.break_time_entry.insert(0, "10")
+    timer.update_times()
+    assert timer.work_time == 30 * 60
+    assert timer.break_time == 10 * 60
+    assert timer.time_left == 30 * 60